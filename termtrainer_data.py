@@ -0,0 +1,621 @@
+"""
+TermTrainer 命令题库
+只包含数据字面量，字节码由解释器缓存在 __pycache__ 中
+"""
+
+COMMANDS_DB = {
+    "file_operations": {
+        "name": "文件操作",
+        "icon": "📁",
+        "commands": [
+            {
+                "command": "ls",
+                "description": "列出目录内容",
+                "examples": ["ls", "ls -la", "ls -lh", "ls -R"],
+                "exercises": [
+                    {"question": "列出当前目录的所有文件（包括隐藏文件）", "answers": ["ls -a", "ls -A", "ls --all"]},
+                    {"question": "以详细格式列出文件，并显示人类可读的文件大小", "answers": ["ls -lh", "ls -hl"]},
+                    {"question": "递归列出所有子目录的内容", "answers": ["ls -R", "ls --recursive"]},
+                ]
+            },
+            {
+                "command": "cat",
+                "description": "显示文件内容",
+                "examples": ["cat file.txt", "cat -n file.txt", "cat file1 file2"],
+                "exercises": [
+                    {"question": "显示文件 config.txt 的内容并带行号", "answers": ["cat -n config.txt", "cat --number config.txt"]},
+                    {"question": "合并 a.txt 和 b.txt 的内容并显示", "answers": ["cat a.txt b.txt"]},
+                ]
+            },
+            {
+                "command": "cp",
+                "description": "复制文件或目录",
+                "examples": ["cp file1 file2", "cp -r dir1 dir2", "cp -i file dest"],
+                "exercises": [
+                    {"question": "递归复制整个 src 目录到 backup", "answers": ["cp -r src backup", "cp -R src backup", "cp --recursive src backup"]},
+                    {"question": "复制文件时保留原有属性（权限、时间戳等）", "answers": ["cp -p file dest", "cp --preserve file dest", "cp -a file dest"]},
+                ]
+            },
+            {
+                "command": "mv",
+                "description": "移动或重命名文件",
+                "examples": ["mv old new", "mv file dir/", "mv -i file dest"],
+                "exercises": [
+                    {"question": "将 old_name.txt 重命名为 new_name.txt", "answers": ["mv old_name.txt new_name.txt"]},
+                    {"question": "移动文件时如果目标存在则提示确认", "answers": ["mv -i file dest", "mv --interactive file dest"]},
+                ]
+            },
+            {
+                "command": "rm",
+                "description": "删除文件或目录",
+                "examples": ["rm file", "rm -r dir", "rm -f file"],
+                "exercises": [
+                    {"question": "递归删除整个 temp 目录及其内容", "answers": ["rm -r temp", "rm -R temp", "rm --recursive temp", "rm -rf temp"]},
+                    {"question": "删除文件前提示确认", "answers": ["rm -i file", "rm --interactive file"]},
+                ]
+            },
+            {
+                "command": "touch",
+                "description": "创建空文件或更新时间戳",
+                "examples": ["touch file.txt", "touch -t 202401010000 file"],
+                "exercises": [
+                    {"question": "创建一个名为 newfile.txt 的空文件", "answers": ["touch newfile.txt"]},
+                    {"question": "同时创建 a.txt, b.txt, c.txt 三个文件", "answers": ["touch a.txt b.txt c.txt"]},
+                ]
+            },
+            {
+                "command": "head",
+                "description": "显示文件开头部分",
+                "examples": ["head file", "head -n 20 file", "head -c 100 file"],
+                "exercises": [
+                    {"question": "显示 log.txt 文件的前15行", "answers": ["head -n 15 log.txt", "head -15 log.txt", "head --lines=15 log.txt"]},
+                ]
+            },
+            {
+                "command": "tail",
+                "description": "显示文件结尾部分",
+                "examples": ["tail file", "tail -n 20 file", "tail -f log"],
+                "exercises": [
+                    {"question": "实时监控 app.log 文件的新增内容", "answers": ["tail -f app.log", "tail --follow app.log"]},
+                    {"question": "显示 data.txt 的最后25行", "answers": ["tail -n 25 data.txt", "tail -25 data.txt"]},
+                ]
+            },
+        ]
+    },
+    "directory_operations": {
+        "name": "目录操作",
+        "icon": "📂",
+        "commands": [
+            {
+                "command": "cd",
+                "description": "切换目录",
+                "examples": ["cd /path", "cd ~", "cd ..", "cd -"],
+                "exercises": [
+                    {"question": "返回上一级目录", "answers": ["cd .."]},
+                    {"question": "切换到用户主目录", "answers": ["cd ~", "cd", "cd $HOME"]},
+                    {"question": "返回上一次所在的目录", "answers": ["cd -"]},
+                ]
+            },
+            {
+                "command": "pwd",
+                "description": "显示当前工作目录",
+                "examples": ["pwd", "pwd -P"],
+                "exercises": [
+                    {"question": "显示当前所在目录的完整路径", "answers": ["pwd"]},
+                ]
+            },
+            {
+                "command": "mkdir",
+                "description": "创建目录",
+                "examples": ["mkdir dir", "mkdir -p a/b/c", "mkdir -m 755 dir"],
+                "exercises": [
+                    {"question": "创建多层嵌套目录 project/src/main", "answers": ["mkdir -p project/src/main", "mkdir --parents project/src/main"]},
+                    {"question": "创建目录并设置权限为755", "answers": ["mkdir -m 755 mydir", "mkdir --mode=755 mydir"]},
+                ]
+            },
+            {
+                "command": "rmdir",
+                "description": "删除空目录",
+                "examples": ["rmdir dir", "rmdir -p a/b/c"],
+                "exercises": [
+                    {"question": "删除空目录 empty_folder", "answers": ["rmdir empty_folder"]},
+                ]
+            },
+            {
+                "command": "tree",
+                "description": "以树形结构显示目录",
+                "examples": ["tree", "tree -L 2", "tree -d"],
+                "exercises": [
+                    {"question": "显示目录树，但只显示2层深度", "answers": ["tree -L 2"]},
+                    {"question": "只显示目录，不显示文件", "answers": ["tree -d"]},
+                ]
+            },
+        ]
+    },
+    "text_processing": {
+        "name": "文本处理",
+        "icon": "📝",
+        "commands": [
+            {
+                "command": "grep",
+                "description": "文本搜索",
+                "examples": ["grep pattern file", "grep -r pattern dir", "grep -i pattern file"],
+                "exercises": [
+                    {"question": "在 code.py 中搜索包含 'error' 的行（忽略大小写）", "answers": ["grep -i error code.py", "grep --ignore-case error code.py"]},
+                    {"question": "递归搜索目录中所有包含 'TODO' 的文件", "answers": ["grep -r TODO .", "grep -R TODO .", "grep --recursive TODO ."]},
+                    {"question": "显示匹配行及其前后各2行的上下文", "answers": ["grep -C 2 pattern file", "grep --context=2 pattern file"]},
+                ]
+            },
+            {
+                "command": "sed",
+                "description": "流编辑器",
+                "examples": ["sed 's/old/new/g' file", "sed -i '' 's/a/b/g' file"],
+                "exercises": [
+                    {"question": "将文件中所有 'foo' 替换为 'bar'", "answers": ["sed 's/foo/bar/g' file", "sed 's/foo/bar/g' file"]},
+                    {"question": "删除文件中的空行", "answers": ["sed '/^$/d' file"]},
+                ]
+            },
+            {
+                "command": "awk",
+                "description": "文本分析工具",
+                "examples": ["awk '{print $1}' file", "awk -F: '{print $1}' file"],
+                "exercises": [
+                    {"question": "打印文件每行的第一列（默认空格分隔）", "answers": ["awk '{print $1}' file"]},
+                    {"question": "使用冒号作为分隔符，打印第一和第三列", "answers": ["awk -F: '{print $1,$3}' file", "awk -F':' '{print $1,$3}' file"]},
+                ]
+            },
+            {
+                "command": "sort",
+                "description": "排序文本",
+                "examples": ["sort file", "sort -n file", "sort -r file"],
+                "exercises": [
+                    {"question": "按数字大小排序文件内容", "answers": ["sort -n file", "sort --numeric-sort file"]},
+                    {"question": "逆序排序文件内容", "answers": ["sort -r file", "sort --reverse file"]},
+                ]
+            },
+            {
+                "command": "uniq",
+                "description": "去重或统计重复行",
+                "examples": ["uniq file", "uniq -c file", "uniq -d file"],
+                "exercises": [
+                    {"question": "统计每行出现的次数", "answers": ["uniq -c file", "uniq --count file"]},
+                    {"question": "只显示重复的行", "answers": ["uniq -d file", "uniq --repeated file"]},
+                ]
+            },
+            {
+                "command": "wc",
+                "description": "统计字数、行数等",
+                "examples": ["wc file", "wc -l file", "wc -w file"],
+                "exercises": [
+                    {"question": "统计文件的行数", "answers": ["wc -l file", "wc --lines file"]},
+                    {"question": "统计文件的单词数", "answers": ["wc -w file", "wc --words file"]},
+                ]
+            },
+            {
+                "command": "cut",
+                "description": "切割文本",
+                "examples": ["cut -d: -f1 file", "cut -c1-10 file"],
+                "exercises": [
+                    {"question": "提取以冒号分隔的第一个字段", "answers": ["cut -d: -f1 file", "cut -d ':' -f1 file"]},
+                    {"question": "提取每行的前10个字符", "answers": ["cut -c1-10 file", "cut -c 1-10 file"]},
+                ]
+            },
+        ]
+    },
+    "process_management": {
+        "name": "进程管理",
+        "icon": "⚙️",
+        "commands": [
+            {
+                "command": "ps",
+                "description": "显示进程状态",
+                "examples": ["ps", "ps aux", "ps -ef"],
+                "exercises": [
+                    {"question": "显示所有用户的所有进程详细信息", "answers": ["ps aux", "ps -ef"]},
+                    {"question": "显示当前用户的进程", "answers": ["ps", "ps -u $USER"]},
+                ]
+            },
+            {
+                "command": "top",
+                "description": "实时显示进程状态",
+                "examples": ["top", "top -o cpu", "top -o mem"],
+                "exercises": [
+                    {"question": "按CPU使用率排序显示进程", "answers": ["top -o cpu", "top -o %CPU"]},
+                ]
+            },
+            {
+                "command": "kill",
+                "description": "终止进程",
+                "examples": ["kill PID", "kill -9 PID", "kill -15 PID"],
+                "exercises": [
+                    {"question": "强制终止进程ID为1234的进程", "answers": ["kill -9 1234", "kill -KILL 1234", "kill -SIGKILL 1234"]},
+                    {"question": "优雅终止进程ID为5678的进程", "answers": ["kill 5678", "kill -15 5678", "kill -TERM 5678"]},
+                ]
+            },
+            {
+                "command": "killall",
+                "description": "按名称终止进程",
+                "examples": ["killall process_name", "killall -9 process_name"],
+                "exercises": [
+                    {"question": "终止所有名为 python 的进程", "answers": ["killall python", "killall -9 python"]},
+                ]
+            },
+            {
+                "command": "bg",
+                "description": "将任务放到后台运行",
+                "examples": ["bg", "bg %1"],
+                "exercises": [
+                    {"question": "将当前暂停的任务放到后台继续运行", "answers": ["bg", "bg %1"]},
+                ]
+            },
+            {
+                "command": "fg",
+                "description": "将后台任务调到前台",
+                "examples": ["fg", "fg %1"],
+                "exercises": [
+                    {"question": "将后台任务调回前台运行", "answers": ["fg", "fg %1"]},
+                ]
+            },
+            {
+                "command": "jobs",
+                "description": "显示后台任务列表",
+                "examples": ["jobs", "jobs -l"],
+                "exercises": [
+                    {"question": "显示当前shell的所有后台任务", "answers": ["jobs", "jobs -l"]},
+                ]
+            },
+            {
+                "command": "nohup",
+                "description": "忽略挂起信号运行命令",
+                "examples": ["nohup command &", "nohup ./script.sh &"],
+                "exercises": [
+                    {"question": "在后台运行 script.sh，即使退出终端也继续运行", "answers": ["nohup ./script.sh &", "nohup sh script.sh &"]},
+                ]
+            },
+        ]
+    },
+    "network": {
+        "name": "网络工具",
+        "icon": "🌐",
+        "commands": [
+            {
+                "command": "curl",
+                "description": "传输数据的命令行工具",
+                "examples": ["curl url", "curl -O url", "curl -X POST url"],
+                "exercises": [
+                    {"question": "下载文件并保存为原始文件名", "answers": ["curl -O url", "curl --remote-name url"]},
+                    {"question": "发送POST请求到指定URL", "answers": ["curl -X POST url", "curl --request POST url"]},
+                    {"question": "显示HTTP响应头信息", "answers": ["curl -I url", "curl --head url"]},
+                ]
+            },
+            {
+                "command": "wget",
+                "description": "网络文件下载",
+                "examples": ["wget url", "wget -c url", "wget -r url"],
+                "exercises": [
+                    {"question": "断点续传下载文件", "answers": ["wget -c url", "wget --continue url"]},
+                    {"question": "递归下载整个网站", "answers": ["wget -r url", "wget --recursive url"]},
+                ]
+            },
+            {
+                "command": "ping",
+                "description": "测试网络连通性",
+                "examples": ["ping host", "ping -c 4 host"],
+                "exercises": [
+                    {"question": "ping google.com 4次后停止", "answers": ["ping -c 4 google.com"]},
+                ]
+            },
+            {
+                "command": "ssh",
+                "description": "安全远程登录",
+                "examples": ["ssh user@host", "ssh -p 2222 user@host", "ssh -i key user@host"],
+                "exercises": [
+                    {"question": "使用指定端口2222连接远程服务器", "answers": ["ssh -p 2222 user@host"]},
+                    {"question": "使用私钥文件连接远程服务器", "answers": ["ssh -i keyfile user@host", "ssh -i ~/.ssh/keyfile user@host"]},
+                ]
+            },
+            {
+                "command": "scp",
+                "description": "安全复制文件到远程",
+                "examples": ["scp file user@host:path", "scp -r dir user@host:path"],
+                "exercises": [
+                    {"question": "将本地 data.txt 复制到远程服务器的 /tmp 目录", "answers": ["scp data.txt user@host:/tmp", "scp data.txt user@host:/tmp/"]},
+                    {"question": "递归复制整个目录到远程服务器", "answers": ["scp -r dir user@host:path", "scp -r dir user@host:/path"]},
+                ]
+            },
+            {
+                "command": "netstat",
+                "description": "显示网络连接状态",
+                "examples": ["netstat -an", "netstat -tlnp"],
+                "exercises": [
+                    {"question": "显示所有监听中的TCP端口", "answers": ["netstat -tln", "netstat -an | grep LISTEN"]},
+                ]
+            },
+            {
+                "command": "lsof",
+                "description": "列出打开的文件",
+                "examples": ["lsof", "lsof -i :8080", "lsof -p PID"],
+                "exercises": [
+                    {"question": "查看哪个进程占用了8080端口", "answers": ["lsof -i :8080"]},
+                ]
+            },
+        ]
+    },
+    "permission_ownership": {
+        "name": "权限与所有权",
+        "icon": "🔐",
+        "commands": [
+            {
+                "command": "chmod",
+                "description": "修改文件权限",
+                "examples": ["chmod 755 file", "chmod +x file", "chmod -R 644 dir"],
+                "exercises": [
+                    {"question": "给脚本文件添加可执行权限", "answers": ["chmod +x script.sh", "chmod u+x script.sh"]},
+                    {"question": "设置文件权限为所有者可读写执行，其他人只读", "answers": ["chmod 744 file", "chmod u=rwx,go=r file"]},
+                    {"question": "递归修改目录及其所有内容的权限为755", "answers": ["chmod -R 755 dir", "chmod --recursive 755 dir"]},
+                ]
+            },
+            {
+                "command": "chown",
+                "description": "修改文件所有者",
+                "examples": ["chown user file", "chown user:group file", "chown -R user dir"],
+                "exercises": [
+                    {"question": "修改文件所有者为 admin", "answers": ["chown admin file", "sudo chown admin file"]},
+                    {"question": "同时修改文件的所有者和所属组", "answers": ["chown user:group file"]},
+                ]
+            },
+            {
+                "command": "chgrp",
+                "description": "修改文件所属组",
+                "examples": ["chgrp group file", "chgrp -R group dir"],
+                "exercises": [
+                    {"question": "修改文件的所属组为 developers", "answers": ["chgrp developers file"]},
+                ]
+            },
+            {
+                "command": "sudo",
+                "description": "以管理员权限执行命令",
+                "examples": ["sudo command", "sudo -u user command", "sudo -i"],
+                "exercises": [
+                    {"question": "以root权限编辑系统配置文件", "answers": ["sudo vim /etc/hosts", "sudo nano /etc/hosts", "sudo vi /etc/hosts"]},
+                    {"question": "切换到root用户的shell", "answers": ["sudo -i", "sudo su -", "sudo -s"]},
+                ]
+            },
+        ]
+    },
+    "compression": {
+        "name": "压缩与解压",
+        "icon": "📦",
+        "commands": [
+            {
+                "command": "tar",
+                "description": "打包和解包文件",
+                "examples": ["tar -cvf archive.tar files", "tar -xvf archive.tar", "tar -czvf archive.tar.gz files"],
+                "exercises": [
+                    {"question": "创建一个gzip压缩的tar包", "answers": ["tar -czvf archive.tar.gz files", "tar -czf archive.tar.gz files"]},
+                    {"question": "解压tar.gz文件到当前目录", "answers": ["tar -xzvf archive.tar.gz", "tar -xzf archive.tar.gz"]},
+                    {"question": "查看tar包中的文件列表（不解压）", "answers": ["tar -tvf archive.tar", "tar -tf archive.tar"]},
+                ]
+            },
+            {
+                "command": "gzip",
+                "description": "压缩文件",
+                "examples": ["gzip file", "gzip -d file.gz", "gzip -k file"],
+                "exercises": [
+                    {"question": "压缩文件并保留原文件", "answers": ["gzip -k file", "gzip --keep file"]},
+                    {"question": "解压gzip文件", "answers": ["gzip -d file.gz", "gunzip file.gz"]},
+                ]
+            },
+            {
+                "command": "zip",
+                "description": "创建zip压缩包",
+                "examples": ["zip archive.zip files", "zip -r archive.zip dir"],
+                "exercises": [
+                    {"question": "递归压缩整个目录为zip文件", "answers": ["zip -r archive.zip dir"]},
+                ]
+            },
+            {
+                "command": "unzip",
+                "description": "解压zip文件",
+                "examples": ["unzip archive.zip", "unzip -d dir archive.zip"],
+                "exercises": [
+                    {"question": "解压zip文件到指定目录", "answers": ["unzip archive.zip -d dir", "unzip -d dir archive.zip"]},
+                    {"question": "查看zip包内容（不解压）", "answers": ["unzip -l archive.zip"]},
+                ]
+            },
+        ]
+    },
+    "system_info": {
+        "name": "系统信息",
+        "icon": "💻",
+        "commands": [
+            {
+                "command": "uname",
+                "description": "显示系统信息",
+                "examples": ["uname", "uname -a", "uname -r"],
+                "exercises": [
+                    {"question": "显示完整的系统信息", "answers": ["uname -a", "uname --all"]},
+                    {"question": "只显示内核版本", "answers": ["uname -r", "uname --kernel-release"]},
+                ]
+            },
+            {
+                "command": "df",
+                "description": "显示磁盘空间使用情况",
+                "examples": ["df", "df -h", "df -T"],
+                "exercises": [
+                    {"question": "以人类可读格式显示磁盘使用情况", "answers": ["df -h", "df --human-readable"]},
+                ]
+            },
+            {
+                "command": "du",
+                "description": "显示目录空间使用情况",
+                "examples": ["du", "du -sh dir", "du -h --max-depth=1"],
+                "exercises": [
+                    {"question": "显示当前目录的总大小（人类可读格式）", "answers": ["du -sh .", "du -sh"]},
+                    {"question": "显示当前目录下各子目录的大小", "answers": ["du -h --max-depth=1", "du -h -d 1"]},
+                ]
+            },
+            {
+                "command": "free",
+                "description": "显示内存使用情况",
+                "examples": ["free", "free -h", "free -m"],
+                "exercises": [
+                    {"question": "以人类可读格式显示内存使用情况", "answers": ["free -h", "free --human"]},
+                ]
+            },
+            {
+                "command": "uptime",
+                "description": "显示系统运行时间",
+                "examples": ["uptime"],
+                "exercises": [
+                    {"question": "查看系统运行了多长时间", "answers": ["uptime"]},
+                ]
+            },
+            {
+                "command": "whoami",
+                "description": "显示当前用户名",
+                "examples": ["whoami"],
+                "exercises": [
+                    {"question": "显示当前登录的用户名", "answers": ["whoami"]},
+                ]
+            },
+            {
+                "command": "which",
+                "description": "显示命令的路径",
+                "examples": ["which python", "which -a python"],
+                "exercises": [
+                    {"question": "查找python命令的完整路径", "answers": ["which python", "which python3"]},
+                ]
+            },
+            {
+                "command": "env",
+                "description": "显示环境变量",
+                "examples": ["env", "env | grep PATH"],
+                "exercises": [
+                    {"question": "显示所有环境变量", "answers": ["env", "printenv"]},
+                ]
+            },
+            {
+                "command": "echo",
+                "description": "输出文本或变量",
+                "examples": ["echo hello", "echo $PATH", "echo -n text"],
+                "exercises": [
+                    {"question": "显示PATH环境变量的值", "answers": ["echo $PATH"]},
+                    {"question": "输出文本但不换行", "answers": ["echo -n text", "echo -n 'text'"]},
+                ]
+            },
+        ]
+    },
+    "search_find": {
+        "name": "搜索与查找",
+        "icon": "🔍",
+        "commands": [
+            {
+                "command": "find",
+                "description": "查找文件",
+                "examples": ["find . -name '*.txt'", "find / -type f -size +100M", "find . -mtime -7"],
+                "exercises": [
+                    {"question": "在当前目录递归查找所有 .py 文件", "answers": ["find . -name '*.py'", "find . -name \"*.py\""]},
+                    {"question": "查找大于100MB的文件", "answers": ["find . -size +100M", "find . -type f -size +100M"]},
+                    {"question": "查找7天内修改过的文件", "answers": ["find . -mtime -7", "find . -type f -mtime -7"]},
+                    {"question": "查找所有空目录", "answers": ["find . -type d -empty"]},
+                ]
+            },
+            {
+                "command": "locate",
+                "description": "快速查找文件（基于数据库）",
+                "examples": ["locate filename", "locate -i filename"],
+                "exercises": [
+                    {"question": "忽略大小写搜索文件名包含config的文件", "answers": ["locate -i config"]},
+                ]
+            },
+            {
+                "command": "whereis",
+                "description": "查找命令的二进制文件、源文件和手册",
+                "examples": ["whereis ls", "whereis python"],
+                "exercises": [
+                    {"question": "查找 bash 命令的所有相关文件", "answers": ["whereis bash"]},
+                ]
+            },
+        ]
+    },
+    "advanced": {
+        "name": "高级技巧",
+        "icon": "🚀",
+        "commands": [
+            {
+                "command": "|",
+                "description": "管道 - 将一个命令的输出作为另一个的输入",
+                "examples": ["ls | grep txt", "cat file | sort | uniq", "ps aux | grep python"],
+                "exercises": [
+                    {"question": "列出所有文件并只显示包含 .log 的行", "answers": ["ls | grep .log", "ls | grep '\\.log'"]},
+                    {"question": "统计当前目录下的文件数量", "answers": ["ls | wc -l", "ls -1 | wc -l"]},
+                ]
+            },
+            {
+                "command": ">",
+                "description": "输出重定向 - 将输出写入文件（覆盖）",
+                "examples": ["echo hello > file.txt", "ls > files.txt"],
+                "exercises": [
+                    {"question": "将 ls 命令的输出保存到 files.txt", "answers": ["ls > files.txt"]},
+                ]
+            },
+            {
+                "command": ">>",
+                "description": "追加重定向 - 将输出追加到文件",
+                "examples": ["echo line >> file.txt"],
+                "exercises": [
+                    {"question": "将文本追加到日志文件末尾", "answers": ["echo 'log entry' >> log.txt", "echo \"log entry\" >> log.txt"]},
+                ]
+            },
+            {
+                "command": "&&",
+                "description": "逻辑与 - 前一命令成功才执行后一命令",
+                "examples": ["mkdir dir && cd dir", "make && make install"],
+                "exercises": [
+                    {"question": "创建目录 project 后立即进入该目录", "answers": ["mkdir project && cd project"]},
+                ]
+            },
+            {
+                "command": "||",
+                "description": "逻辑或 - 前一命令失败才执行后一命令",
+                "examples": ["test -f file || touch file"],
+                "exercises": [
+                    {"question": "如果文件不存在则创建它", "answers": ["test -f file || touch file", "[ -f file ] || touch file"]},
+                ]
+            },
+            {
+                "command": "xargs",
+                "description": "构建并执行命令行",
+                "examples": ["find . -name '*.txt' | xargs rm", "cat urls.txt | xargs wget"],
+                "exercises": [
+                    {"question": "删除所有查找到的 .tmp 文件", "answers": ["find . -name '*.tmp' | xargs rm", "find . -name '*.tmp' -exec rm {} \\;"]},
+                ]
+            },
+            {
+                "command": "alias",
+                "description": "创建命令别名",
+                "examples": ["alias ll='ls -la'", "alias ..='cd ..'"],
+                "exercises": [
+                    {"question": "创建别名 ll 代表 ls -la", "answers": ["alias ll='ls -la'", "alias ll=\"ls -la\""]},
+                ]
+            },
+            {
+                "command": "history",
+                "description": "显示命令历史",
+                "examples": ["history", "history 20", "!123"],
+                "exercises": [
+                    {"question": "显示最近执行的20条命令", "answers": ["history 20", "history | tail -20"]},
+                ]
+            },
+            {
+                "command": "!!",
+                "description": "执行上一条命令",
+                "examples": ["!!", "sudo !!"],
+                "exercises": [
+                    {"question": "以管理员权限重新执行上一条命令", "answers": ["sudo !!"]},
+                ]
+            },
+        ]
+    },
+}